@@ -87,6 +87,9 @@ class Client:
         The port the bypass script is running on. Defaults to 9090
     bypass_host: str = "http://localhost"
         The host of the bypass script.
+    pool_events: bool = False
+        If set to True, a single `Message` object is reused for every chat message event.
+        Handlers must not keep a reference to it, or read from it after their first `await`.
 
     Attributes
     -----------
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Coroutine, Optional, TypeVar, Union
 from urllib.parse import urlencode, quote
 
@@ -53,6 +54,7 @@ if TYPE_CHECKING:
         DestinationInfoPayload,
     )
     from .types.videos import GetVideosPayload
+    from .users import PartialUser
 
     T = TypeVar("T")
     Response = Coroutine[Any, Any, T]
@@ -133,12 +135,14 @@ class HTTPClient:
         self.globally_locked: bool = False
         self.__regex_token_task: asyncio.Task | None = None
         self._credentials: Credentials | None = None
+        self._partial_users: OrderedDict[int, PartialUser] = OrderedDict()
 
         self.user_agent = f"Kick.py V{__version__} (github.com/cibere/kick.py)"
 
         self.bypass_port = client._options.get("bypass_port", 9090)
         self.bypass_host = client._options.get("bypass_host", "http://localhost")
         self.whitelisted = client._options.get("whitelisted", False)
+        self.pool_events = client._options.get("pool_events", False)
 
     async def regen_token_coro(self) -> None:
         await asyncio.sleep(2419200)  # 28 days just to be safe
@@ -216,7 +220,7 @@ class HTTPClient:
         actual_ws = await self.__session.ws_connect(
             f"wss://ws-us2.pusher.com/app/32cbd69e4b950bf97679?protocol=7&client=js&version=8.4.0-rc2&flash=false"
         )
-        self.ws = PusherWebSocket(actual_ws, http=self)
+        self.ws = PusherWebSocket(actual_ws, http=self, pool_events=self.pool_events)
         self.client.dispatch("ready")
         await self.ws.start()
 
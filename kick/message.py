@@ -7,10 +7,21 @@ from .object import HTTPDataclass
 from .users import PartialUser, User
 from .utils import cached_property
 
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
 if TYPE_CHECKING:
     from .chatroom import Chatroom, PartialChatroom
+    from .http import HTTPClient
     from .types.message import PartialAuthorPayload, AuthorPayload, MessagePayload, MessageDeletedPayload, MessagePinPayload, ReplyMetaData, UserBannedPayload, UserUnbannedPayload
 
+# Reply targets repeat a lot, so the PartialUser objects for them are shared
+# through a small LRU kept on the HTTPClient (`HTTPClient._partial_users`).
+_PARTIAL_USER_CACHE_SIZE = 1024
+
+
 __all__ = ("PartialAuthor", "Author", "Message", "PartialMessage", "MessageDeletedEventData", "PinnedMessage", "UserBannedEventData", "UserUnbannedEventData")
 
 
@@ -28,6 +39,8 @@ class PartialAuthor(HTTPDataclass["PartialAuthorPayload"]):
         The author's username
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> int:
         """
@@ -100,6 +113,8 @@ class Author(PartialAuthor, HTTPDataclass["AuthorPayload"]):
         Unknown
     """
 
+    __slots__ = ()
+
     @property
     def color(self) -> str:
         """
@@ -131,6 +146,8 @@ class PartialMessage(HTTPDataclass["ReplyMetaData"]):
         The message's author
     """
 
+    __slots__ = ("_cs_author",)
+
     @property
     def id(self) -> str:
         """
@@ -153,17 +170,26 @@ class PartialMessage(HTTPDataclass["ReplyMetaData"]):
         The message's author
         """
 
-        return PartialUser(
-            id=int(self._data["original_sender"]["id"]),
-            username=self._data["original_sender"]["username"],
-            http=self.http,
-        )
+        sender = self._data["original_sender"]
+        user_id = int(sender["id"])
+        cache = self.http._partial_users
+
+        user = cache.pop(user_id, None)
+        if user is None:
+            user = PartialUser(id=user_id, username=sender["username"], http=self.http)
+            if len(cache) >= _PARTIAL_USER_CACHE_SIZE:
+                cache.popitem(last=False)
+        elif user.username != sender["username"]:
+            user.username = sender["username"]
+
+        cache[user_id] = user
+        return user
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, self.__class__) and other.id == self.id
 
     def __repr__(self) -> str:
-        return f"<Message id={self.id!r} author={self.author!r}>"
+        return f"<Message id={self._data['original_message']['id']!r} author={self._data['original_sender']['username']!r}>"
 
 
 class Message(HTTPDataclass["MessagePayload"]):
@@ -190,6 +216,8 @@ class Message(HTTPDataclass["MessagePayload"]):
         The message's author
     """
 
+    __slots__ = ("_cs__reply_meta", "_cs_references", "_cs_created_at", "_cs_author")
+
     @property
     def id(self) -> str:
         """
@@ -199,21 +227,26 @@ class Message(HTTPDataclass["MessagePayload"]):
         return self._data["id"]
 
     @cached_property
+    def _reply_meta(self) -> ReplyMetaData | None:
+        return self._data.get("metadata") or None
+
+    @property
     def is_reply(self) -> bool:
         """
         If the message is replying to any message
         """
 
-        return bool(self._data.get("metadata"))
+        return self._reply_meta is not None
 
     @cached_property
     def references(self) -> PartialMessage | None:
         """
         If the message is replying to a message, a `PartialMessage` object is returned. Otherwise None
+        Use `is_reply` to only check if the message is a reply, without creating the `PartialMessage`.
         """
 
-        data = self._data.get("metadata")
-        if not data:
+        data = self._reply_meta
+        if data is None:
             return
         return PartialMessage(data=data, http=self.http)
 
@@ -247,7 +280,7 @@ class Message(HTTPDataclass["MessagePayload"]):
         When the message was sent
         """
 
-        return datetime.fromisoformat(self._data["created_at"])
+        return parse_datetime(self._data["created_at"])
 
     @cached_property
     def author(self) -> Author:
@@ -257,11 +290,20 @@ class Message(HTTPDataclass["MessagePayload"]):
 
         return Author(data=self._data["sender"], http=self.http)
 
+    def _rebind(self, data: MessagePayload, http: HTTPClient) -> None:
+        self._data = data
+        self.http = http
+        for slot in Message.__slots__:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                pass
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, self.__class__) and other.id == self.id
 
     def __repr__(self) -> str:
-        return f"<Message id={self.id!r} chatroom={self.chatroom_id!r} author={self.author!r}>"
+        return f"<Message id={self._data['id']!r} chatroom={self._data['chatroom_id']!r} sender_id={self._data['sender']['id']!r} sender_slug={self._data['sender']['slug']!r}>"
 
 class MessageDeletedEventData(HTTPDataclass["MessageDeletedPayload"]):
     """
@@ -280,6 +322,9 @@ class MessageDeletedEventData(HTTPDataclass["MessageDeletedPayload"]):
     chatroom: `Chatroom` | None
         The chatroom the message was sent in.
     """
+
+    __slots__ = ("_cs_ai_moderated",)
+
     @property
     def id(self) -> str:
         """
@@ -332,6 +377,8 @@ class PinnedMessage(HTTPDataclass["MessagePinPayload"]):
         Who pin the message
     """
 
+    __slots__ = ("_cs_message", "_cs_duration", "_cs_pinned_by")
+
     @cached_property
     def message(self) -> Message:
         """
@@ -355,7 +402,7 @@ class PinnedMessage(HTTPDataclass["MessagePinPayload"]):
         return Author(data=self._data["pinnedBy"], http=self.http)
 
     def __repr__(self) -> str:
-        return f"<PinnedMessage message={self.message!r} duration={self.duration!r} pinned_by={self.pinned_by!r}>"
+        return f"<PinnedMessage message={self._data['message']['id']!r} duration={self._data['duration']!r} pinned_by={self._data['pinnedBy']['slug']!r}>"
 
 
 class UserBannedEventData(HTTPDataclass["UserBannedPayload"]):
@@ -370,10 +417,24 @@ class UserBannedEventData(HTTPDataclass["UserBannedPayload"]):
         The banned user
     banned_by: `PartialAuthor`
         Member who banned the user
+    user_id: int
+        The banned user's id
+    user_username: str
+        The banned user's username
+    user_slug: str
+        The banned user's slug
+    banned_by_id: int
+        The id of the member who banned the user
+    banned_by_username: str
+        The username of the member who banned the user
+    banned_by_slug: str
+        The slug of the member who banned the user
     is_permanent: bool
         If ban is permanent
     """
 
+    __slots__ = ("_cs_is_permanent", "_cs_user", "_cs_banned_by")
+
     @property
     def id(self) -> str:
         """
@@ -406,11 +467,59 @@ class UserBannedEventData(HTTPDataclass["UserBannedPayload"]):
 
         return PartialAuthor(data=self._data["banned_by"], http=self.http)
 
+    @property
+    def user_id(self) -> int:
+        """
+        The banned user's id
+        """
+
+        return self._data["user"]["id"]
+
+    @property
+    def user_username(self) -> str:
+        """
+        The banned user's username
+        """
+
+        return self._data["user"]["username"]
+
+    @property
+    def user_slug(self) -> str:
+        """
+        The banned user's slug
+        """
+
+        return self._data["user"]["slug"]
+
+    @property
+    def banned_by_id(self) -> int:
+        """
+        The id of the member who banned the user
+        """
+
+        return self._data["banned_by"]["id"]
+
+    @property
+    def banned_by_username(self) -> str:
+        """
+        The username of the member who banned the user
+        """
+
+        return self._data["banned_by"]["username"]
+
+    @property
+    def banned_by_slug(self) -> str:
+        """
+        The slug of the member who banned the user
+        """
+
+        return self._data["banned_by"]["slug"]
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, self.__class__) and other.id == self.id
 
     def __repr__(self) -> str:
-        return f"<UserBannedEventData banned={self.user!r} by={self.banned_by!r}>"
+        return f"<UserBannedEventData banned={self._data['user']['slug']!r} by={self._data['banned_by']['slug']!r}>"
 
 
 class UserUnbannedEventData(HTTPDataclass["UserUnbannedPayload"]):
@@ -425,10 +534,24 @@ class UserUnbannedEventData(HTTPDataclass["UserUnbannedPayload"]):
         The unbanned user
     unbanned_by: `PartialAuthor`
         Member who banned the user / Member who unbanned the user ??
+    user_id: int
+        The unbanned user's id
+    user_username: str
+        The unbanned user's username
+    user_slug: str
+        The unbanned user's slug
+    unbanned_by_id: int
+        The id of the member who unbanned the user
+    unbanned_by_username: str
+        The username of the member who unbanned the user
+    unbanned_by_slug: str
+        The slug of the member who unbanned the user
     is_permanent: bool
         If ban was permanent / If unban is permanent ??
     """
 
+    __slots__ = ("_cs_is_permanent", "_cs_user", "_cs_unbanned_by")
+
     @property
     def id(self) -> str:
         """
@@ -461,8 +584,56 @@ class UserUnbannedEventData(HTTPDataclass["UserUnbannedPayload"]):
 
         return PartialAuthor(data=self._data["unbanned_by"], http=self.http)
 
+    @property
+    def user_id(self) -> int:
+        """
+        The unbanned user's id
+        """
+
+        return self._data["user"]["id"]
+
+    @property
+    def user_username(self) -> str:
+        """
+        The unbanned user's username
+        """
+
+        return self._data["user"]["username"]
+
+    @property
+    def user_slug(self) -> str:
+        """
+        The unbanned user's slug
+        """
+
+        return self._data["user"]["slug"]
+
+    @property
+    def unbanned_by_id(self) -> int:
+        """
+        The id of the member who unbanned the user
+        """
+
+        return self._data["unbanned_by"]["id"]
+
+    @property
+    def unbanned_by_username(self) -> str:
+        """
+        The username of the member who unbanned the user
+        """
+
+        return self._data["unbanned_by"]["username"]
+
+    @property
+    def unbanned_by_slug(self) -> str:
+        """
+        The slug of the member who unbanned the user
+        """
+
+        return self._data["unbanned_by"]["slug"]
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, self.__class__) and other.id == self.id
 
     def __repr__(self) -> str:
-        return f"<UserUnbannedEventData unbanned={self.user!r} by={self.unbanned_by!r}>"
+        return f"<UserUnbannedEventData unbanned={self._data['user']['slug']!r} by={self._data['unbanned_by']['slug']!r}>"
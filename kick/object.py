@@ -12,6 +12,8 @@ __all__ = ("BaseDataclass", "HTTPDataclass")
 
 
 class BaseDataclass(Generic[DataT]):
+    __slots__ = ("_data",)
+
     def __init__(self, *, data: DataT) -> None:
         self._data = data
 
@@ -20,6 +22,8 @@ class BaseDataclass(Generic[DataT]):
 
 
 class HTTPDataclass(Generic[DataT]):
+    __slots__ = ("_data", "http")
+
     def __init__(self, *, data: DataT, http: HTTPClient) -> None:
         self._data = data
         self.http = http
@@ -90,5 +90,5 @@ class UserBannedPayload(TypedDict):
 class UserUnbannedPayload(TypedDict):
     id : str
     user : PartialAuthorPayload
-    banned_by : PartialAuthorPayload
+    unbanned_by : PartialAuthorPayload
     permanent : bool
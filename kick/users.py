@@ -265,9 +265,25 @@ class User:
         The categories the user has recently gone live in
     """
 
+    __slots__ = (
+        "_data",
+        "http",
+        "follower_count",
+        "_cs_online_banner",
+        "_cs_offline_banner",
+        "_cs_avatar",
+        "_cs_email_verified_at",
+        "_cs_socials",
+        "_cs_livestream",
+        "_cs_chatroom",
+        "_cs_recent_categories",
+    )
+
     def __init__(self, *, data: UserPayload, http: HTTPClient) -> None:
         self._data = data
         self.http = http
+        # Kept outside of `_data` so follow events can update it directly
+        self.follower_count: int = data["followers_count"]
 
     @property
     def id(self) -> int:
@@ -299,10 +315,6 @@ class User:
     def subscription_enabled(self) -> bool:
         return self._data["subscription_enabled"]
 
-    @property
-    def follower_count(self) -> int:
-        return self._data["followers_count"]
-
     @property
     def subscriber_badges(self) -> list[SubscriberBadge]:
         return [
@@ -1,20 +1,50 @@
 from __future__ import annotations
 
 import logging
-from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, Type
 
 
-def _cached_property(func: Callable):
-    @wraps(func)
-    def getter(parent: Type):
-        cache = getattr(parent, "__cached_properties", {})
-        if func.__name__ not in cache.keys():
-            cache[func.__name__] = func(parent)
-            parent.__cached_properties = cache
-        return parent.__cached_properties[func.__name__]
-
-    return property(getter)
+class _cached_property:
+    """
+    A property whose value is computed once per instance.
+
+    Like `functools.cached_property`, the value is written to the instance
+    `__dict__` under the property's name, so later reads never reach the
+    descriptor. Instances without a `__dict__` store it in the `_cs_<name>`
+    attribute instead, so classes using `__slots__` must list that name for
+    every cached property they define.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.slot = f"_cs_{func.__name__}"
+        self.use_dict = True
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+        self.slot = f"_cs_{name}"
+        self.use_dict = owner.__dictoffset__ != 0
+        if not self.use_dict and not any(
+            self.slot in getattr(cls, "__slots__", ()) for cls in owner.__mro__
+        ):
+            raise TypeError(f"{owner.__name__} must list {self.slot!r} in __slots__ to use cached_property {name!r}")
+
+    def __get__(self, instance: Any, owner: Type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        if self.use_dict:
+            value = instance.__dict__[self.name] = self.func(instance)
+            return value
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
 
 
 if TYPE_CHECKING:
@@ -1,68 +1,216 @@
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING
+import asyncio
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
-from aiohttp import ClientWebSocketResponse as WebSocketResponse
+from aiohttp import ClientWebSocketResponse as WebSocketResponse, WSMessage, WSMsgType
 import logging
 from .livestream import PartialLivestream
-from .message import Message, MessageDeletedEventData, PinnedMessage, UserBannedEventData, UserUnbannedEventData
+from .message import (
+    Message,
+    MessageDeletedEventData,
+    PinnedMessage,
+    UserBannedEventData,
+    UserUnbannedEventData,
+)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
 
 if TYPE_CHECKING:
     from .http import HTTPClient
 
 LOG = logging.getLogger(__name__)
 
+CHAT_MESSAGE_EVENT = sys.intern("App\\Events\\ChatMessageEvent")
+MESSAGE_DELETED_EVENT = sys.intern("App\\Events\\MessageDeletedEvent")
+PINNED_MESSAGE_CREATED_EVENT = sys.intern("App\\Events\\PinnedMessageCreatedEvent")
+PINNED_MESSAGE_DELETED_EVENT = sys.intern("App\\Events\\PinnedMessageDeletedEvent")
+USER_BANNED_EVENT = sys.intern("App\\Events\\UserBannedEvent")
+USER_UNBANNED_EVENT = sys.intern("App\\Events\\UserUnbannedEvent")
+STREAMER_IS_LIVE_EVENT = sys.intern("App\\Events\\StreamerIsLive")
+FOLLOWERS_UPDATED_EVENT = sys.intern("App\\Events\\FollowersUpdated")
+
+# Event name -> name of the PusherWebSocket method that handles it
+_EVENT_HANDLERS = {
+    CHAT_MESSAGE_EVENT: "_on_chat",
+    MESSAGE_DELETED_EVENT: "_on_delete",
+    PINNED_MESSAGE_CREATED_EVENT: "_on_pin",
+    PINNED_MESSAGE_DELETED_EVENT: "_on_pin_delete",
+    USER_BANNED_EVENT: "_on_ban",
+    USER_UNBANNED_EVENT: "_on_unban",
+    STREAMER_IS_LIVE_EVENT: "_on_livestream_start",
+    FOLLOWERS_UPDATED_EVENT: "_on_followers_update",
+}
+
 __all__ = ()
 
 
+_FRAME_PREFIX = '{"event":"'
+_FRAME_DATA = '","data":"'
+_FRAME_CHANNEL = '","channel":"'
+
+
+def _parse_pusher_frame(raw: str) -> tuple[str, Any] | None:
+    """
+    Parses a `{"event": ..., "data": "<json>", "channel": ...}` Pusher frame
+    in one go, decoding the nested data without decoding the envelope first.
+
+    Returns `None` if the frame doesn't have that exact shape, in which case
+    it should be parsed normally.
+    """
+
+    if not raw.startswith(_FRAME_PREFIX) or not raw.endswith('"}'):
+        return None
+
+    event_end = raw.find(_FRAME_DATA, len(_FRAME_PREFIX))
+    # Quotes inside the data string are escaped, so the last unescaped
+    # `","channel":"` always belongs to the envelope.
+    data_end = raw.rfind(_FRAME_CHANNEL)
+    if event_end == -1 or data_end < event_end:
+        return None
+
+    event = raw[len(_FRAME_PREFIX) : event_end]
+    data = raw[event_end + len(_FRAME_DATA) : data_end]
+    try:
+        if "\\" in event:
+            # Kick's own event names only ever escape backslashes.
+            unescaped = event.replace("\\\\", "\\")
+            event = unescaped if unescaped in _EVENT_HANDLERS else json_loads(f'"{event}"')
+        # Undo the envelope's string escaping. Escapes other than \\ and \"
+        # are left as they are, since they are valid inside the nested JSON
+        # strings; anything else makes json_loads fail and we fall back.
+        if "\\\\" in data:
+            data = "\\".join(part.replace('\\"', '"') for part in data.split("\\\\"))
+        else:
+            data = data.replace('\\"', '"')
+        data = json_loads(data)
+    except ValueError:
+        return None
+
+    return event, data
+
+
+@lru_cache(maxsize=4096)
+def _chatroom_channel(chatroom_id: int) -> str:
+    return f"chatrooms.{chatroom_id}.v2"
+
+
+@lru_cache(maxsize=4096)
+def _channel_channel(channel_id: int) -> str:
+    return f"channel.{channel_id}"
+
+
 class PusherWebSocket:
-    def __init__(self, ws: WebSocketResponse, *, http: HTTPClient):
+    def __init__(self, ws: WebSocketResponse, *, http: HTTPClient, pool_events: bool = False):
         self.ws = ws
         self.http = http
+        self._pool_msg: Message | None = Message.__new__(Message) if pool_events else None
         self.send_json = ws.send_json
         self.close = ws.close
+        self.dispatch = http.client.dispatch
+        self._dispatch: dict[str, Callable[[Any], None]] = {
+            event: getattr(self, handler) for event, handler in _EVENT_HANDLERS.items()
+        }
 
     async def poll_event(self) -> None:
         raw_msg = await self.ws.receive()
-        LOG.debug(f"WS received: {raw_msg}")
-        raw_data = raw_msg.json()
-        data = json.loads(raw_data["data"])
-
-        self.http.client.dispatch("payload_receive", raw_data["event"], data)
-        self.http.client.dispatch("raw_payload_receive", raw_data)
-
-        match raw_data["event"]:
-            case "App\\Events\\ChatMessageEvent":
-                msg = Message(data=data, http=self.http)
-                self.http.client.dispatch("message", msg)
-            case "App\\Events\\MessageDeletedEvent":
-                msg = MessageDeletedEventData(data=data, http=self.http)
-                self.http.client.dispatch("message_delete", msg)
-            case "App\\Events\\PinnedMessageCreatedEvent":
-                msg = PinnedMessage(data=data, http=self.http)
-                self.http.client.dispatch("pin_message", msg)
-            case "App\\Events\\PinnedMessageDeletedEvent":
-                self.http.client.dispatch("pinned_message_delete")
-            case "App\\Events\\UserBannedEvent":
-                event_data = UserBannedEventData(data=data, http=self.http)
-                self.http.client.dispatch("user_banned", event_data)
-            case "App\\Events\\UserUnbannedEvent":
-                event_data = UserUnbannedEventData(data=data, http=self.http)
-                self.http.client.dispatch("user_unbanned", event_data)
-            case "App\\Events\\StreamerIsLive":
-                livestream = PartialLivestream(data=data, http=self.http)
-                self.http.client.dispatch("livestream_start", livestream)
-            case "App\\Events\\FollowersUpdated":
-                user = self.http.client._watched_users[data["channel_id"]]
-                if data["followed"] is True:
-                    event = "follow"
-                    user._data["followers_count"] += 1
-                else:
-                    event = "unfollow"
-                    user._data["followers_count"] -= 1
-
-                self.http.client.dispatch(event, user)
+        self._handle_frame(raw_msg)
+        if self._pool_msg is not None:
+            # Handlers are scheduled as tasks, and `receive` doesn't suspend
+            # while frames are buffered, so yield once to let them start
+            # before the pooled message is rebound to the next frame.
+            await asyncio.sleep(0)
+
+    def _handle_frame(self, raw_msg: WSMessage) -> None:
+        dispatch = self.dispatch
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(f"WS received: {raw_msg}")
+
+        msg_type = raw_msg.type
+        if msg_type is WSMsgType.ERROR:
+            raise raw_msg.data
+        # Close frames carry no payload; start() stops once the socket is closed
+        if msg_type is WSMsgType.CLOSE or msg_type is WSMsgType.CLOSING or msg_type is WSMsgType.CLOSED:
+            return
+
+        # The single-pass parser never builds the envelope dict, so it is only
+        # used when nothing is listening for the raw payload. orjson decodes
+        # both layers faster than the string slicing here, so it is skipped then.
+        frame = None
+        if (
+            not HAS_ORJSON
+            and msg_type is WSMsgType.TEXT
+            and getattr(self.http.client, "on_raw_payload_receive", None) is None
+        ):
+            frame = _parse_pusher_frame(raw_msg.data)
+
+        if frame is None:
+            raw_data = json_loads(raw_msg.data)
+            event = raw_data["event"]
+            # Pusher's own events (pusher:ping, ...) may send data as an object
+            data = raw_data["data"]
+            if isinstance(data, str):
+                data = json_loads(data)
+        else:
+            raw_data = None
+            event, data = frame
+
+        dispatch("payload_receive", event, data)
+        if raw_data is not None:
+            dispatch("raw_payload_receive", raw_data)
+
+        handler = self._dispatch.get(event)
+        if handler is not None:
+            handler(data)
+
+    def _on_chat(self, data: Any) -> None:
+        msg = self._pool_msg
+        if msg is None:
+            msg = Message(data=data, http=self.http)
+        else:
+            msg._rebind(data, self.http)
+        self.dispatch("message", msg)
+
+    def _on_delete(self, data: Any) -> None:
+        msg = MessageDeletedEventData(data=data, http=self.http)
+        self.dispatch("message_delete", msg)
+
+    def _on_pin(self, data: Any) -> None:
+        msg = PinnedMessage(data=data, http=self.http)
+        self.dispatch("pin_message", msg)
+
+    def _on_pin_delete(self, data: Any) -> None:
+        self.dispatch("pinned_message_delete")
+
+    def _on_ban(self, data: Any) -> None:
+        event_data = UserBannedEventData(data=data, http=self.http)
+        self.dispatch("user_banned", event_data)
+
+    def _on_unban(self, data: Any) -> None:
+        event_data = UserUnbannedEventData(data=data, http=self.http)
+        self.dispatch("user_unbanned", event_data)
+
+    def _on_livestream_start(self, data: Any) -> None:
+        livestream = PartialLivestream(data=data, http=self.http)
+        self.dispatch("livestream_start", livestream)
+
+    def _on_followers_update(self, data: Any) -> None:
+        user = self.http.client._watched_users[data["channel_id"]]
+        if data["followed"]:
+            user.follower_count += 1
+            self.dispatch("follow", user)
+        else:
+            user.follower_count -= 1
+            self.dispatch("unfollow", user)
 
     async def start(self) -> None:
         while not self.ws.closed:
@@ -72,7 +220,7 @@ class PusherWebSocket:
         await self.send_json(
             {
                 "event": "pusher:subscribe",
-                "data": {"auth": "", "channel": f"chatrooms.{chatroom_id}.v2"},
+                "data": {"auth": "", "channel": _chatroom_channel(chatroom_id)},
             }
         )
 
@@ -80,7 +228,7 @@ class PusherWebSocket:
         await self.send_json(
             {
                 "event": "pusher:unsubscribe",
-                "data": {"auth": "", "channel": f"chatrooms.{chatroom_id}.v2"},
+                "data": {"auth": "", "channel": _chatroom_channel(chatroom_id)},
             }
         )
 
@@ -88,14 +236,14 @@ class PusherWebSocket:
         await self.send_json(
             {
                 "event": "pusher:subscribe",
-                "data": {"auth": "", "channel": f"channel.{channel_id}"},
+                "data": {"auth": "", "channel": _channel_channel(channel_id)},
             }
         )
 
     async def unwatch_channel(self, channel_id: int) -> None:
         await self.send_json(
             {
-                "event": "pusher:subscribe",
-                "data": {"auth": "", "channel": f"channel.{channel_id}"},
+                "event": "pusher:unsubscribe",
+                "data": {"auth": "", "channel": _channel_channel(channel_id)},
             }
         )
@@ -58,6 +58,9 @@ setuptools.setup(
     version="0.0.1",
     python_requires=">=3.11",
     install_requires=REQUIREMENTS,
+    extras_require={
+        "speed": ["ciso8601", "orjson"],
+    },
     packages=PACKAGES,
     description="",
     long_description=LONG_DESCRIPTION,